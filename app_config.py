@@ -2,12 +2,13 @@
 Global configuration for the OCSS project.
 Defines file paths and common constants used across the system.
 """
+import os
 from pathlib import Path
 
-# Base directory for data
+# Base directory for data (override with OCSS_DATA_DIR)
 BASE_DIR = Path(__file__).parent
-DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
+DATA_DIR = Path(os.environ.get("OCSS_DATA_DIR", BASE_DIR / "data"))
+DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # JSON data files
 CUSTOMERS_FILE = DATA_DIR / "customers.json"
@@ -21,6 +22,9 @@ SHIPMENTS_FILE = DATA_DIR / "shipments.json"
 CARTS_FILE = DATA_DIR / "carts.json"
 STAFF_FILE = DATA_DIR / "staff.json"
 
+# Set OCSS_SYNC=1 to fsync data files on every save (crash-safe, but slower)
+SYNC_WRITES = os.environ.get("OCSS_SYNC", "0") == "1"
+
 # Business logic constants
 MIN_PASSWORD_LENGTH = 8
 MAX_CART_ITEMS = 50
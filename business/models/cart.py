@@ -5,6 +5,7 @@ Each cart stores CartItem objects that reference real Product instances.
 
 from typing import Dict, List
 from decimal import Decimal
+from business.models.money import from_cents
 from storage.storage_manager import StorageManager
 from business.models.product import Product
 from business.models.cart_item import CartItem
@@ -31,30 +32,15 @@ class Cart:
         }
 
     def reserve_all(self) -> None:
-        """Reserves stock for all items in the cart."""
-        inv = Inventory.get_instance()
-        reserved: List[Dict] = []
-        try:
-            for cart_item in self.items:
-                inv.reserve_stock(cart_item.product.id, cart_item.quantity)
-                reserved.append({
-                    "product_id": cart_item.product.id,
-                    "qty": cart_item.quantity
-                })
-        except Exception:
-            # Roll back any reservations if one fails
-            for r in reserved:
-                try:
-                    inv.release_stock(r["product_id"], r["qty"])
-                except Exception:
-                    pass
-            raise
+        """Reserves stock for all items in the cart (all or nothing)."""
+        Inventory.get_instance().reserve_batch(self._stock_lines())
 
     def release_all(self) -> None:
         """Releases any reserved stock for this cart."""
-        inv = Inventory.get_instance()
-        for cart_item in self.items:
-            inv.release_stock(cart_item.product.id, cart_item.quantity)
+        Inventory.get_instance().release_batch(self._stock_lines())
+
+    def _stock_lines(self) -> List[Dict]:
+        return [{"product_id": i.product.id, "qty": i.quantity} for i in self.items]
 
     def clear_and_save(self) -> None:
         """Clears the cart and updates storage."""
@@ -84,12 +70,23 @@ class Cart:
         if qty < 0:
             raise ValueError("Quantity cannot be negative")
 
+        if qty == 0:
+            self.remove_item(product_id)
+            return
+
         for cart_item in self.items:
             if cart_item.product.id == product_id:
-                if qty == 0:
-                    self.items.remove(cart_item)
-                else:
-                    cart_item.update_quantity(qty)
+                cart_item.update_quantity(qty)
+                self._save()
+                return
+
+        raise ValueError("Item not found in cart")
+
+    def remove_item(self, product_id: int) -> None:
+        """Removes a product from the cart."""
+        for i, cart_item in enumerate(self.items):
+            if cart_item.product.id == product_id:
+                del self.items[i]
                 self._save()
                 return
 
@@ -102,7 +99,11 @@ class Cart:
 
     def total(self) -> Decimal:
         """Calculates the total value of the cart as a Decimal."""
-        return sum((item.subtotal for item in self.items), Decimal("0"))
+        return from_cents(self.total_cents())
+
+    def total_cents(self) -> int:
+        """Calculates the total value of the cart in whole cents."""
+        return sum(item.subtotal_cents for item in self.items)
 
     # ---------------- Persistence ----------------
 
@@ -146,6 +147,18 @@ class Cart:
             carts.append(self.to_dict())
         s.save_all("carts", carts)
 
+    @staticmethod
+    def is_empty_for(customer_id: int) -> bool:
+        """
+        Checks a customer's stored cart record for items.
+        Still scans the carts list, but skips building CartItems and their product lookups.
+        """
+        s = StorageManager()
+        for c in s.load("carts"):
+            if c["customer_id"] == customer_id:
+                return not c.get("items")
+        return True
+
     @staticmethod
     def get_or_create_for_customer(customer_id: int) -> "Cart":
         """Finds an existing cart for a customer, or creates a new one."""
@@ -5,6 +5,7 @@ Each CartItem stores a Product reference and the selected quantity.
 
 from typing import Dict
 from decimal import Decimal
+from business.models.money import from_cents
 
 
 class CartItem:
@@ -26,7 +27,12 @@ class CartItem:
 
     def _calculate_subtotal(self) -> None:
         """Calculates subtotal based on product price and quantity."""
-        self.subtotal = Decimal(str(self.product.price)) * self.quantity
+        self.subtotal_cents = self.product.price_cents * self.quantity
+
+    @property
+    def subtotal(self) -> Decimal:
+        """Line subtotal as a Decimal, for display and legacy callers."""
+        return from_cents(self.subtotal_cents)
 
     def update_quantity(self, new_qty: int) -> None:
         """Updates the item quantity and recalculates subtotal."""
@@ -41,9 +47,9 @@ class CartItem:
         return {
             "product_id": self.product.id,
             "name": self.product.name,
-            "price": float(self.product.price),
+            "price": self.product.price_cents / 100,
             "qty": self.quantity,
-            "subtotal": float(self.subtotal)
+            "subtotal": self.subtotal_cents / 100
         }
 
     @staticmethod
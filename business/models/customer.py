@@ -58,18 +58,21 @@ class Customer:
         from business.models.order import Order
         from business.models.invoice import Invoice
         from business.models.payment import PaymentFactory
-        from business.models.inventory import Inventory
         from business.exceptions.errors import CartEmptyError, InsufficientStockError
 
         cart = self.get_cart()
         if cart.is_empty():
             raise CartEmptyError("Cannot checkout with empty cart")
 
-        inv = Inventory.get_instance()
+        # Reserve stock for the order (all or nothing, so no release on failure)
         try:
-            # Reserve stock for the order
             cart.reserve_all()
+        except InsufficientStockError as e:
+            return {"success": False, "message": str(e)}
+        except Exception as e:
+            return {"success": False, "message": f"Stock reservation failed: {e}"}
 
+        try:
             # Create order and invoice
             snapshot = cart.to_order_snapshot()
             order = Order.create(self.id, snapshot["items"], snapshot["total"])
@@ -93,10 +96,6 @@ class Customer:
                 "total": order.total
             }
 
-        except InsufficientStockError as e:
-            cart.release_all()
-            return {"success": False, "message": str(e)}
-
         except Exception as e:
             cart.release_all()
             return {"success": False, "message": f"Checkout failed: {e}"}
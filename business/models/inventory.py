@@ -78,26 +78,41 @@ class Inventory:
     # --- Batch operations ---
 
     def reserve_batch(self, items: List[Dict]) -> None:
-        """Reserves stock for multiple items at once, with rollback on failure."""
-        reserved = []
-        try:
-            for it in items:
-                pid, qty = int(it["product_id"]), int(it["qty"])
-                self.reserve_stock(pid, qty)
-                reserved.append({"product_id": pid, "qty": qty})
-        except Exception:
-            # Roll back any successful reservations if one fails
-            for r in reserved:
-                try:
-                    self.release_stock(r["product_id"], r["qty"])
-                except Exception:
-                    pass
-            raise
+        """
+        Reserves stock for multiple items at once, saving a single time.
+        Every item is checked before any stock is taken, so nothing is reserved on failure.
+        """
+        wanted: Dict[int, int] = {}
+        for it in items:
+            pid, qty = int(it["product_id"]), int(it["qty"])
+            if qty <= 0:
+                raise ValueError("Quantity must be positive")
+            wanted[pid] = wanted.get(pid, 0) + qty
+
+        for pid, qty in wanted.items():
+            current = self.check_stock(pid)
+            if current < qty:
+                raise InsufficientStockError(f"Only {current} units available for product {pid}")
+
+        for pid, qty in wanted.items():
+            self._stock_cache[pid] -= qty
+        self._save_stock()
 
     def release_batch(self, items: List[Dict]) -> None:
-        """Releases stock for multiple items at once."""
+        """
+        Releases stock for multiple items at once, saving a single time.
+        Every item is checked before any stock is returned, so nothing changes on failure.
+        """
+        returned: Dict[int, int] = {}
         for it in items:
-            self.release_stock(int(it["product_id"]), int(it["qty"]))
+            pid, qty = int(it["product_id"]), int(it["qty"])
+            if qty <= 0:
+                raise ValueError("Quantity must be positive")
+            returned[pid] = returned.get(pid, 0) + qty
+
+        for pid, qty in returned.items():
+            self._stock_cache[pid] = self.check_stock(pid) + qty
+        self._save_stock()
 
     # --- Singleton access ---
 
@@ -0,0 +1,17 @@
+"""
+Helpers for holding money as whole cents.
+Prices and totals are kept as int cents so cart and checkout maths stays in integer arithmetic;
+Decimal is only built when a value is shown or stored.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def to_cents(amount) -> int:
+    """Converts a price (Decimal, float, int or numeric string) to whole cents."""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Converts whole cents back to a Decimal amount."""
+    return Decimal(cents) / 100
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, TYPE_CHECKING
 from datetime import datetime
 from decimal import Decimal
 from storage.storage_manager import StorageManager
+from business.models.money import to_cents, from_cents
 
 if TYPE_CHECKING:
     from business.models.customer import Customer
@@ -25,10 +26,15 @@ class Order:
         self.id = id
         self.customer = customer
         self.items = items
-        self.total = Decimal(str(total))
+        self.total_cents = to_cents(total)
         self.status = status
         self.created_at = created_at
 
+    @property
+    def total(self) -> Decimal:
+        """Order total as a Decimal, for display and legacy callers."""
+        return from_cents(self.total_cents)
+
     # -------------Order workflow actions----------------------- #
 
     def generate_invoice(self):
@@ -60,7 +66,7 @@ class Order:
             "id": self.id,
             "customer_id": self.customer.id,
             "items": self.items,
-            "total": float(self.total),
+            "total": self.total_cents / 100,
             "status": self.status,
             "created_at": self.created_at,
         }
@@ -78,7 +84,7 @@ class Order:
         rec = s.add("orders", {
             "customer_id": customer_id,
             "items": items,
-            "total": float(Decimal(str(total))),
+            "total": to_cents(total) / 100,
             "status": "CREATED",
             "created_at": datetime.now().isoformat(),
         })
@@ -103,7 +109,7 @@ class Order:
             id=data["id"],
             customer=customer,
             items=data.get("items", []),
-            total=Decimal(str(data["total"])),
+            total=data["total"],
             status=data["status"],
             created_at=data["created_at"],
         )
@@ -127,7 +133,7 @@ class Order:
         return {
             "order_id": self.id,
             "customer_name": self.customer.name,
-            "total": float(self.total),
+            "total": self.total_cents / 100,
             "status": self.status,
         }
 
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional
 from decimal import Decimal
 from storage.storage_manager import StorageManager
 from business.models.inventory import Inventory
+from business.models.money import to_cents, from_cents
 
 
 class Product:
@@ -16,9 +17,14 @@ class Product:
         self.id = id
         self.name = name
         self.description = description
-        self.price = Decimal(str(price))
+        self.price_cents = to_cents(price)
         self.category = category
 
+    @property
+    def price(self) -> Decimal:
+        """Unit price as a Decimal, for display and legacy callers."""
+        return from_cents(self.price_cents)
+
     # -----------Stock operations--------------------------------------- #
 
     def reserve_stock(self, qty: int) -> None:
@@ -48,7 +54,7 @@ class Product:
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "price": float(self.price),
+            "price": self.price_cents / 100,
             "category": self.category,
         }
 
@@ -59,7 +65,7 @@ class Product:
             id=data.get("id"),
             name=data.get("name"),
             description=data.get("description", "No description available"),
-            price=Decimal(str(data.get("price", 0.0))),
+            price=data.get("price", 0.0),
             category=data.get("category", "Uncategorized"),
         )
 
@@ -83,7 +89,7 @@ class Product:
         rec = s.add("products", {
             "name": name,
             "description": description,
-            "price": float(Decimal(str(price))),
+            "price": to_cents(price) / 100,
             "category": category,
         })
         return Product.from_dict(rec)
@@ -4,7 +4,7 @@ Each strategy summarizes sales over a specific time period:
 daily, monthly, or all-time.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime
 from storage.storage_manager import StorageManager
 
@@ -14,6 +14,17 @@ class ReportStrategy:
     def generate(self) -> List[Dict]:
         raise NotImplementedError("Subclasses must implement this method.")
 
+    @staticmethod
+    def _summarize(orders: List[Dict], period: str = "") -> Tuple[int, float]:
+        """Counts orders created in `period` (an ISO date prefix) and sums their totals in one pass."""
+        count = 0
+        revenue = 0.0
+        for o in orders:
+            if o["created_at"].startswith(period):
+                count += 1
+                revenue += float(o["total"])
+        return count, revenue
+
 
 class DailyReportStrategy(ReportStrategy):
     """Generates a report for the current day's sales."""
@@ -22,12 +33,11 @@ class DailyReportStrategy(ReportStrategy):
         orders = s.load("orders")
         today = datetime.now().date().isoformat()
 
-        todays_orders = [o for o in orders if o["created_at"][:10] == today]
-        revenue = sum(float(o["total"]) for o in todays_orders)
+        count, revenue = self._summarize(orders, today)
 
         return [
             {"metric": "Report Type", "value": "Daily"},
-            {"metric": "Orders Today", "value": len(todays_orders)},
+            {"metric": "Orders Today", "value": count},
             {"metric": "Revenue Today", "value": f"{revenue:.2f}"},
         ]
 
@@ -39,12 +49,11 @@ class MonthlyReportStrategy(ReportStrategy):
         orders = s.load("orders")
         current_month = datetime.now().strftime("%Y-%m")
 
-        month_orders = [o for o in orders if o["created_at"][:7] == current_month]
-        revenue = sum(float(o["total"]) for o in month_orders)
+        count, revenue = self._summarize(orders, current_month)
 
         return [
             {"metric": "Report Type", "value": "Monthly"},
-            {"metric": "Orders This Month", "value": len(month_orders)},
+            {"metric": "Orders This Month", "value": count},
             {"metric": "Revenue This Month", "value": f"{revenue:.2f}"},
         ]
 
@@ -54,11 +63,11 @@ class AllTimeReportStrategy(ReportStrategy):
     def generate(self) -> List[Dict]:
         s = StorageManager()
         orders = s.load("orders")
-        revenue = sum(float(o["total"]) for o in orders)
+        count, revenue = self._summarize(orders)
 
         return [
             {"metric": "Report Type", "value": "All-Time"},
-            {"metric": "Total Orders", "value": len(orders)},
+            {"metric": "Total Orders", "value": count},
             {"metric": "Total Revenue", "value": f"{revenue:.2f}"},
 
         ]
@@ -9,6 +9,7 @@ from storage.storage_manager import StorageManager
 from business.models.product import Product
 from business.models.inventory import Inventory
 from business.models.cart import Cart
+from business.models.cart_item import CartItem
 
 
 class CartService:
@@ -21,14 +22,14 @@ class CartService:
     def browse_products(self, category: str | None = None) -> List[Dict]:
         """Returns available products and current stock levels."""
         products = Product.get_all()
+        needle = category.lower() if category else None
         items = []
 
         for product in products:
-            stock = self.inventory.check_stock(product.id)
-
-            if category and product.category.lower() != category.lower():
+            if needle and product.category.lower() != needle:
                 continue
 
+            stock = self.inventory.check_stock(product.id)
             items.append({
                 "id": product.id,
                 "name": product.name,
@@ -62,24 +63,27 @@ class CartService:
         except Exception as e:
             return {"success": False, "message": str(e)}
 
+    @staticmethod
+    def empty_cart() -> Dict:
+        """Returns the get_cart() result for a cart with no items."""
+        return {"items": [], "items_by_id": {}, "total": 0.0, "total_cents": 0}
+
     def get_cart(self, customer_id: int) -> Dict:
-        """Returns a customer's cart and total value."""
+        """Returns a customer's cart, its items keyed by product ID, and total value."""
         cart = Cart.get_or_create_for_customer(customer_id)
 
         if not cart.items:
-            return {"items": [], "total": 0.0}
-
-        formatted = []
-        for item in cart.items:
-            formatted.append({
-                "product_id": item.product.id,
-                "name": item.product.name,
-                "price": float(item.product.price),
-                "qty": item.quantity,
-                "subtotal": float(item.subtotal),
-            })
+            return self.empty_cart()
 
-        return {"items": formatted, "total": float(cart.total())}
+        # CartItem.to_dict() already yields the display shape
+        formatted = list(map(CartItem.to_dict, cart.items))
+
+        return {
+            "items": formatted,
+            "items_by_id": {item["product_id"]: item for item in formatted},
+            "total": float(cart.total()),
+            "total_cents": cart.total_cents(),
+        }
 
     def update_item_quantity(self, customer_id: int, product_id: int, new_qty: int) -> Dict:
         """Updates an item’s quantity or removes it if zero."""
@@ -92,7 +96,12 @@ class CartService:
 
     def remove_item(self, customer_id: int, product_id: int) -> Dict:
         """Removes an item from the cart."""
-        return self.update_item_quantity(customer_id, product_id, 0)
+        cart = Cart.get_or_create_for_customer(customer_id)
+        try:
+            cart.remove_item(product_id)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        return {"success": True, "message": "Item removed from cart"}
 
     def clear_cart(self, customer_id: int) -> Dict:
         """Empties a customer's cart."""
@@ -23,58 +23,63 @@ class OrderService:
 
     def create_order(self, customer_id: int, payment_method: str = "card") -> Dict:
         """Creates an order, processes payment, and generates invoice."""
-        cart = Cart.get_or_create_for_customer(customer_id)
-        if not cart.items:
-            raise CartEmptyError("Cannot checkout with empty cart")
-
-        total = cart.total()
-
-        try:
-            cart.reserve_all()
-        except InsufficientStockError as e:
-            return {"success": False, "message": str(e)}
-        except Exception as e:
-            cart.release_all()
-            return {"success": False, "message": f"Stock reservation failed: {e}"}
-
-        order_items = [
-            {
-                "product_id": i.product.id,
-                "name": i.product.name,
-                "quantity": i.quantity,
-                "price": float(i.product.price),
-                "subtotal": float(i.subtotal),
+        # Each entity touched by checkout is written once, when the block exits
+        with StorageManager.transaction():
+            # is_empty_for skips building the cart's items when there are none;
+            # a loaded cart can still be empty if all its products were deleted
+            cart = None if Cart.is_empty_for(customer_id) else Cart.get_or_create_for_customer(customer_id)
+            if cart is None or not cart.items:
+                raise CartEmptyError("Cannot checkout with empty cart")
+
+            total = cart.total()
+
+            # reserve_all() checks every item before taking any stock,
+            # so nothing is released here.
+            try:
+                cart.reserve_all()
+            except InsufficientStockError as e:
+                return {"success": False, "message": str(e)}
+            except Exception as e:
+                return {"success": False, "message": f"Stock reservation failed: {e}"}
+
+            order_items = [
+                {
+                    "product_id": i.product.id,
+                    "name": i.product.name,
+                    "quantity": i.quantity,
+                    "price": float(i.product.price),
+                    "subtotal": float(i.subtotal),
+                }
+                for i in cart.items
+            ]
+
+            try:
+                order = Order.create(customer_id, order_items, total)
+            except ValueError as e:
+                cart.release_all()
+                return {"success": False, "message": str(e)}
+
+            invoice = Invoice.create(order.id, total)
+
+            try:
+                payment = PaymentFactory.create(payment_method, total, order.id)
+                msg = payment.process()
+            except Exception as e:
+                cart.release_all()
+                return {"success": False, "message": f"Payment failed: {e}"}
+
+            invoice.mark_paid()
+            order.mark_paid()
+            cart.clear()
+
+            return {
+                "success": True,
+                "order_id": order.id,
+                "invoice_id": invoice.id,
+                "payment_method": payment_method,
+                "total": float(total),
+                "message": msg,
             }
-            for i in cart.items
-        ]
-
-        try:
-            order = Order.create(customer_id, order_items, total)
-        except ValueError as e:
-            cart.release_all()
-            return {"success": False, "message": str(e)}
-
-        invoice = Invoice.create(order.id, total)
-
-        try:
-            payment = PaymentFactory.create(payment_method, total, order.id)
-            msg = payment.process()
-        except Exception as e:
-            cart.release_all()
-            return {"success": False, "message": f"Payment failed: {e}"}
-
-        invoice.mark_paid()
-        order.mark_paid()
-        cart.clear()
-
-        return {
-            "success": True,
-            "order_id": order.id,
-            "invoice_id": invoice.id,
-            "payment_method": payment_method,
-            "total": float(total),
-            "message": msg,
-        }
 
     def ship_order(self, order_id: int, tracking_number: str) -> Dict:
         """Marks an order as shipped and records shipment info."""
@@ -97,14 +102,13 @@ class OrderService:
         if not order_data:
             return {"success": False, "message": f"Order {order_id} not found"}
 
-        invoices = storage.load("invoices")
-        payments = storage.load("payments")
+        loaded = storage.load_many("invoices", "payments")
 
-        invoice = next((i for i in invoices if i["order_id"] == order_id), None)
+        invoice = next((i for i in loaded["invoices"] if i["order_id"] == order_id), None)
         if not invoice:
             return {"success": False, "message": f"No invoice found for order {order_id}"}
 
-        payment = next((p for p in payments if p["order_id"] == order_id), None)
+        payment = next((p for p in loaded["payments"] if p["order_id"] == order_id), None)
         method = payment["method"].title() if payment else "Unknown"
 
         items = []
@@ -5,20 +5,44 @@ Runs the CLI application using Typer and delegates all commands
 to the presentation layer controller.
 """
 
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional
+
 import typer
-from rich.console import Console
-from presentation.cli_controller import CLIController
+from presentation.console import console
+from presentation import messages
 from storage.session_manager import SessionManager
 from storage.storage_manager import StorageManager
 
+# The controller pulls in every business service; import it only when a command needs it
+if TYPE_CHECKING:
+    from presentation.cli_controller import CLIController
+
 app = typer.Typer(
     name="ocss",
     help="Online Convenience Store System (OCSS) - Command-line shop interface",
     add_completion=False,
 )
 
-console = Console()
-controller = CLIController()
+
+@lru_cache(maxsize=1)
+def get_controller() -> "CLIController":
+    """Builds the controller on first use so commands that don't need it skip the setup."""
+    from presentation.cli_controller import CLIController
+    return CLIController()
+
+
+def require_session(user_type: Optional[str] = None) -> Optional[Dict]:
+    """Returns the active session, or prints why the command can't run and returns None."""
+    session = SessionManager.load_session()
+    if not session:
+        console.print(f"[red]{messages.LOGIN_REQUIRED}.[/red]")
+        return None
+    if user_type and session.get("user_type") != user_type:
+        console.print(f"[red]{messages.ROLE_REQUIRED.format(role=user_type.title())}.[/red]")
+        return None
+    return session
+
 
 # ---------------------------------------------------------------------
 # System setup
@@ -26,7 +50,7 @@ controller = CLIController()
 @app.command()
 def init():
     """Initialize the system with sample data."""
-    result = controller.initialize_system()
+    result = get_controller().initialize_system()
     if result["success"]:
         console.print("[green]System initialized with sample data.[/green]")
     else:
@@ -39,7 +63,7 @@ def init():
 @app.command()
 def login(username: str, password: str):
     """Log in as a customer or staff member."""
-    result = controller.login(username, password)
+    result = get_controller().login(username, password)
     color = "green" if result["success"] else "red"
     console.print(f"[{color}]{result.get('message', 'Login failed')}[/{color}]")
 
@@ -47,7 +71,7 @@ def login(username: str, password: str):
 @app.command()
 def logout():
     """Log out from the current session."""
-    result = controller.logout()
+    result = get_controller().logout()
     console.print(f"[green]{result['message']}[/green]")
 
 
@@ -58,7 +82,7 @@ def whoami():
     if session:
         console.print(f"[cyan]Logged in as: {session['username']} ({session['user_type']})[/cyan]")
     else:
-        console.print("[yellow]Not logged in.[/yellow]")
+        console.print(f"[yellow]{messages.NOT_LOGGED_IN}.[/yellow]")
 
 
 # ---------------------------------------------------------------------
@@ -67,16 +91,14 @@ def whoami():
 @app.command()
 def browse(category: str = typer.Argument(None, help="Optional category filter (e.g. Dairy)")):
     """Browse available products."""
-    session = SessionManager.load_session()
-    if not session:
-        console.print("[red]Please login first.[/red]")
+    if not require_session():
         return
 
-    products = controller.browse_products(category)
+    products = get_controller().browse_products(category)
     if not products:
         console.print("[yellow]No products found.[/yellow]")
     else:
-        controller.display_products(products)
+        get_controller().display_products(products)
 
 
 @app.command(name="add-to-cart")
@@ -86,7 +108,7 @@ def add_to_cart(
 ):
 
     """Add a product to your shopping cart."""
-    result = controller.add_to_cart(product_id, quantity)
+    result = get_controller().add_to_cart(product_id, quantity)
     color = "green" if result["success"] else "red"
     console.print(f"[{color}]{result['message']}[/{color}]")
 
@@ -94,33 +116,30 @@ def add_to_cart(
 @app.command(name="view-cart")
 def view_cart():
     """Display the current shopping cart."""
-    session = SessionManager.load_session()
-    if not session:
-        console.print("[red]Please login first.[/red]")
-        return
-    if session.get("user_type") != "customer":
-        console.print("[red]Customer access required.[/red]")
+    if not require_session("customer"):
         return
 
-    cart = controller.view_cart()
+    cart = get_controller().view_cart()
     if not cart.get("items"):
         console.print("[yellow]Your cart is empty.[/yellow]")
     else:
-        controller.display_cart(cart)
+        get_controller().display_cart(cart)
 
 
 @app.command()
-def checkout():
+def checkout(
+    payment: str = typer.Option("card", "--payment", "-p", help="Payment method: card | wallet"),
+):
     """Checkout and process payment for the current cart."""
-    result = controller.checkout()
-    if not result["success"] and result.get("message") != "Cart is empty":
+    result = get_controller().checkout(payment)
+    if not result["success"] and result.get("message") != messages.CART_EMPTY:
         console.print(f"[red]{result['message']}[/red]")
 
 
 @app.command(name="view-invoice")
 def view_invoice(order_id: int = typer.Argument(..., help="Order ID to view invoice for")):
     """View the invoice for a completed order."""
-    controller.view_invoice(order_id)
+    get_controller().view_invoice(order_id)
 
 
 # ---------------------------------------------------------------------
@@ -129,33 +148,23 @@ def view_invoice(order_id: int = typer.Argument(..., help="Order ID to view invo
 @app.command(name="view-orders")
 def view_orders():
     """List all unshipped orders (staff only)."""
-    session = SessionManager.load_session()
-    if not session:
-        console.print("[red]Please login first.[/red]")
-        return
-    if session.get("user_type") != "staff":
-        console.print("[red]Staff access required.[/red]")
+    if not require_session("staff"):
         return
 
-    orders = controller.view_pending_orders()
+    orders = get_controller().view_pending_orders()
     if not orders:
         console.print("[yellow]No pending orders found.[/yellow]")
     else:
-        controller.display_orders(orders)
+        get_controller().display_orders(orders)
 
 
 @app.command(name="ship-order")
 def ship_order(order_id: int, tracking_number: str):
     """Mark an order as shipped."""
-    session = SessionManager.load_session()
-    if not session:
-        console.print("[red]Please login first.[/red]")
-        return
-    if session.get("user_type") != "staff":
-        console.print("[red]Staff access required.[/red]")
+    if not require_session("staff"):
         return
 
-    result = controller.ship_order(order_id, tracking_number)
+    result = get_controller().ship_order(order_id, tracking_number)
     color = "green" if result["success"] else "red"
     console.print(f"[{color}]{result['message']}[/{color}]")
 
@@ -163,15 +172,15 @@ def ship_order(order_id: int, tracking_number: str):
 @app.command(name="generate-report")
 def generate_report(period: str = typer.Argument("daily", help="daily | monthly | all")):
     """Generate a sales or inventory report (staff only)."""
-    report = controller.generate_report(period)
+    report = get_controller().generate_report(period)
     if report:
-        controller.display_report(report)
+        get_controller().display_report(report)
 
 
 @app.command(name="update-stock")
 def update_stock(product_id: int, new_quantity: int):
     """Update product stock levels (staff only)."""
-    result = controller.update_stock(product_id, new_quantity)
+    result = get_controller().update_stock(product_id, new_quantity)
     color = "green" if result["success"] else "red"
     console.print(f"[{color}]{result['message']}[/{color}]")
 
@@ -179,9 +188,7 @@ def update_stock(product_id: int, new_quantity: int):
 @app.command(name="order-status")
 def order_status(order_id: int):
     """Check the status of a specific order."""
-    session = SessionManager.load_session()
-    if not session:
-        console.print("[red]Please login first.[/red]")
+    if not require_session():
         return
 
     order = StorageManager().find_by_id("orders", order_id)
@@ -191,10 +198,12 @@ def order_status(order_id: int):
 
     status = order.get("status", "UNKNOWN").upper()
     display_status = "NOT SHIPPED" if status == "PAID" else status
-    console.print(f"[cyan]Order ID:[/cyan] {order['id']}")
-    console.print(f"[cyan]Customer ID:[/cyan] {order['customer_id']}")
-    console.print(f"[cyan]Total:[/cyan] ${order['total']:.2f}")
-    console.print(f"[cyan]Status:[/cyan] {display_status}")
+    console.print(
+        f"[cyan]Order ID:[/cyan] {order['id']}\n"
+        f"[cyan]Customer ID:[/cyan] {order['customer_id']}\n"
+        f"[cyan]Total:[/cyan] ${order['total']:.2f}\n"
+        f"[cyan]Status:[/cyan] {display_status}"
+    )
 
 
 # ---------------------------------------------------------------------
@@ -3,8 +3,10 @@ Command-line controller that connects user commands to business services.
 Handles login, checkout, stock management, and report generation.
 """
 
-from typing import Dict, List
-from rich.console import Console
+from functools import cached_property, wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from presentation.console import console
+from presentation import messages
 from presentation.formatters import (
     display_products_table,
     display_cart_table,
@@ -12,25 +14,79 @@ from presentation.formatters import (
     display_orders_table,
     display_invoice_table,
 )
-from business.services.auth_service import AuthService
-from business.services.cart_service import CartService
-from business.services.order_service import OrderService
-from business.services.report_service import ReportService
-from business.services.staff_service import StaffService
 from business.exceptions.errors import InsufficientStockError, CartEmptyError
+from storage.storage_manager import StorageManager
+
+# Only needed for annotations; the service modules are imported lazily in CLIController
+if TYPE_CHECKING:
+    from business.services.auth_service import AuthService
+    from business.services.cart_service import CartService
+    from business.services.order_service import OrderService
+    from business.services.report_service import ReportService
+    from business.services.staff_service import StaffService
+
+
+def require_role(role: Optional[str] = None, denied: Optional[Callable[[], Any]] = None):
+    """
+    Guards a controller action behind a logged-in user (of the given role, if any).
+    The user is passed to the action as its first argument. On denial the action
+    returns an error dict, or, when `denied` is given, prints the reason and
+    returns `denied()` for callers that expect data instead of a result dict.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            user = self.auth_service.get_current_user()
+            if not user:
+                message = messages.LOGIN_REQUIRED
+            elif role and user.get("user_type") != role:
+                message = messages.ROLE_REQUIRED.format(role=role.title())
+            else:
+                return fn(self, user, *args, **kwargs)
+
+            if denied is None:
+                return {"success": False, "message": message}
+            console.print(f"[red]{message}.[/red]")
+            return denied()
+        return wrapper
+    return decorator
+
 
-console = Console()
+def _empty_cart() -> Dict:
+    """Empty-cart result in the same shape CartService.get_cart() returns."""
+    from business.services.cart_service import CartService
+    return CartService.empty_cart()
 
 
 class CLIController:
     """Top-level command router for the CLI interface."""
 
-    def __init__(self):
-        self.auth_service = AuthService()
-        self.cart_service = CartService()
-        self.order_service = OrderService()
-        self.report_service = ReportService()
-        self.staff_service = StaffService()
+    # Services are imported and built on first use, so each command only pays for the ones it needs
+
+    @cached_property
+    def auth_service(self) -> "AuthService":
+        from business.services.auth_service import AuthService
+        return AuthService()
+
+    @cached_property
+    def cart_service(self) -> "CartService":
+        from business.services.cart_service import CartService
+        return CartService()
+
+    @cached_property
+    def order_service(self) -> "OrderService":
+        from business.services.order_service import OrderService
+        return OrderService()
+
+    @cached_property
+    def report_service(self) -> "ReportService":
+        from business.services.report_service import ReportService
+        return ReportService()
+
+    @cached_property
+    def staff_service(self) -> "StaffService":
+        from business.services.staff_service import StaffService
+        return StaffService()
 
     # ---------- System setup ----------
     def initialize_system(self) -> Dict:
@@ -48,13 +104,9 @@ class CLIController:
         return self.auth_service.logout()
 
     # ---------- Customer / shared actions ----------
-    def browse_products(self, category: str = None) -> List[Dict]:
+    @require_role(denied=list)
+    def browse_products(self, user: Dict, category: str = None) -> List[Dict]:
         """Show product catalogue (optionally filtered by category)."""
-        user = self.auth_service.get_current_user()
-        if not user:
-            console.print("[red]Please login first.[/red]")
-            return []
-
         try:
             products = self.cart_service.browse_products(category)
             if not products:
@@ -64,57 +116,41 @@ class CLIController:
             console.print(f"[red]Failed to load products: {e}[/red]")
             return []
 
-    def add_to_cart(self, product_id: int, quantity: int) -> Dict:
+    @require_role("customer")
+    def add_to_cart(self, user: Dict, product_id: int, quantity: int) -> Dict:
         """Add a product to the current customer’s cart."""
-        user = self.auth_service.get_current_user()
-        if not user:
-            return {"success": False, "message": "Please login first"}
-        if user.get("user_type") != "customer":
-            return {"success": False, "message": "Customer access required"}
-        return self.cart_service.add_item(user["customer_id"], product_id, quantity)
-
-    def view_cart(self) -> Dict:
-        """Display the current customer’s cart."""
-        user = self.auth_service.get_current_user()
-        if not user:
-            console.print("[red]Please login first.[/red]")
-            return {"items": [], "total": 0.0}
-        if user.get("user_type") != "customer":
-            console.print("[red]Customer access required.[/red]")
-            return {"items": [], "total": 0.0}
+        with StorageManager.transaction():
+            return self.cart_service.add_item(user["customer_id"], product_id, quantity)
 
+    @require_role("customer", denied=_empty_cart)
+    def view_cart(self, user: Dict) -> Dict:
+        """Display the current customer’s cart."""
         cart = self.cart_service.get_cart(user["customer_id"])
         return cart
 
-    def checkout(self) -> Dict:
-        """Process checkout for the logged-in customer."""
-        user = self.auth_service.get_current_user()
-        if not user or user.get("user_type") != "customer":
-            return {"success": False, "message": "Please login first"}
-
-        cart = self.cart_service.get_cart(user["customer_id"])
-        if not cart.get("items"):
-            console.print("[yellow]Cart is empty.[/yellow]")
-            return {"success": False, "message": "Cart is empty"}
+    @require_role("customer")
+    def checkout(self, user: Dict, method: str = "card") -> Dict:
+        """Process checkout for the logged-in customer using the given payment method."""
+        method = method.lower()
+        if method not in ("card", "wallet"):
+            return {"success": False, "message": f"Invalid payment method: {method} (use card or wallet)"}
 
+        # create_order checks for an empty cart itself before loading it
         try:
-            console.print("\n[bold yellow]Select Payment Method:[/bold yellow]")
-            console.print("1. Card\n2. Wallet")
-            choice = input("Enter choice (1 or 2): ").strip()
-            method = "card" if choice == "1" else "wallet"
-
             result = self.order_service.create_order(user["customer_id"], payment_method=method)
 
             if result.get("success"):
-                console.print(f"\n[bold green]Payment successful via {method.title()}[/bold green]")
-                console.print(f"Invoice ID: {result['invoice_id']} | Order ID: {result['order_id']}")
+                console.print(
+                    f"\n[bold green]Payment successful via {method.title()}[/bold green]\n"
+                    f"Invoice ID: {result['invoice_id']} | Order ID: {result['order_id']}"
+                )
             else:
                 console.print(f"[red]Checkout failed:[/red] {result.get('message')}")
             return result
 
-        except CartEmptyError as e:
-            console.print(f"[yellow]{e}[/yellow]")
-            return {"success": False, "message": str(e)}
+        except CartEmptyError:
+            console.print(f"[yellow]{messages.CART_EMPTY}.[/yellow]")
+            return {"success": False, "message": messages.CART_EMPTY}
         except InsufficientStockError as e:
             console.print(f"[red]{e}[/red]")
             return {"success": False, "message": str(e)}
@@ -122,52 +158,31 @@ class CLIController:
             console.print(f"[red]Checkout failed: {e}[/red]")
             return {"success": False, "message": f"Checkout failed: {e}"}
 
-    def view_invoice(self, order_id: int) -> Dict:
+    @require_role("customer", denied=dict)
+    def view_invoice(self, user: Dict, order_id: int) -> Dict:
         """View invoice for a specific order."""
-        user = self.auth_service.get_current_user()
-        if not user or user.get("user_type") != "customer":
-            console.print("[red]Please login first.[/red]")
-            return {}
         result = self.order_service.get_invoice_details(order_id)
         display_invoice_table(result)
         return result
 
     # ---------- Staff actions ----------
-    def ship_order(self, order_id: int, tracking_number: str) -> Dict:
-        user = self.auth_service.get_current_user()
-        if not user or user.get("user_type") != "staff":
-            return {"success": False, "message": "Staff access required"}
+    @require_role("staff")
+    def ship_order(self, user: Dict, order_id: int, tracking_number: str) -> Dict:
         return self.staff_service.ship_order(order_id, tracking_number)
 
-    def generate_report(self, period: str) -> List[Dict]:
-        user = self.auth_service.get_current_user()
-        if not user:
-            console.print("[red]Please login first.[/red]")
-            return []
-        if user.get("user_type") != "staff":
-            console.print("[red]Staff access required.[/red]")
-            return []
+    @require_role("staff", denied=list)
+    def generate_report(self, user: Dict, period: str) -> List[Dict]:
         return self.report_service.generate(period)
 
-    def view_pending_orders(self) -> List[Dict]:
-        user = self.auth_service.get_current_user()
-        if not user:
-            console.print("[red]Please login first.[/red]")
-            return []
-        if user.get("user_type") != "staff":
-            console.print("[red]Staff access required.[/red]")
-            return []
+    @require_role("staff", denied=list)
+    def view_pending_orders(self, user: Dict) -> List[Dict]:
         orders = self.staff_service.view_pending_orders()
         if not orders:
             console.print("[yellow]No pending orders found.[/yellow]")
         return orders
 
-    def update_stock(self, product_id: int, new_quantity: int) -> Dict:
-        user = self.auth_service.get_current_user()
-        if not user:
-            return {"success": False, "message": "Please login first"}
-        if user.get("user_type") != "staff":
-            return {"success": False, "message": "Staff access required"}
+    @require_role("staff")
+    def update_stock(self, user: Dict, product_id: int, new_quantity: int) -> Dict:
         return self.staff_service.update_stock(product_id, new_quantity)
 
     # ---------- Display helpers ----------
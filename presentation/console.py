@@ -0,0 +1,8 @@
+"""
+Shared Rich console for all terminal output.
+The CLI entry point, controller, and formatters print through this one instance.
+"""
+
+from rich.console import Console
+
+console = Console()
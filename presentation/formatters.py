@@ -4,9 +4,49 @@ Used by the CLI to show products, carts, invoices, reports, and orders.
 """
 
 from rich.table import Table
-from rich.console import Console
+from rich.console import Group
+from rich.text import Text
+from presentation.console import console
+
+# Pre-styled cell shared by every out-of-stock row, so its markup is never re-parsed
+_OUT_OF_STOCK = Text("Out of Stock", style="red")
+
+# Column specs per table kind: (header, add_column options)
+_PRODUCT_COLUMNS = (
+    ("ID", {"justify": "right", "style": "cyan"}),
+    ("Name", {"style": "magenta"}),
+    ("Category", {"style": "blue"}),
+    ("Price", {"style": "green"}),
+    ("Stock", {"style": "yellow"}),
+)
+_LINE_ITEM_COLUMNS = (
+    ("Product", {"style": "cyan"}),
+    ("Qty", {"justify": "right", "style": "yellow"}),
+    ("Price", {"justify": "right", "style": "green"}),
+    ("Subtotal", {"justify": "right", "style": "magenta"}),
+)
+_REPORT_COLUMNS = (
+    ("Metric", {"style": "cyan"}),
+    ("Value", {"justify": "right", "style": "green"}),
+)
+_ORDER_COLUMNS = (
+    ("Product ID", {"justify": "right"}),
+    ("Name", {}),
+    ("Qty", {"justify": "right"}),
+    ("Price", {"justify": "right"}),
+    ("Subtotal", {"justify": "right"}),
+)
+
+
+def _new_table(title, columns, rows=()):
+    """Build a table from a column spec and pre-formatted rows."""
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    for row in rows:
+        table.add_row(*row)
+    return table
 
-console = Console()
 
 # ---------Product catalogue display----------------------------------------------------------
 def display_products_table(products):
@@ -15,18 +55,17 @@ def display_products_table(products):
         console.print("[yellow]No products found[/yellow]")
         return
 
-    table = Table(title="Product Catalogue")
-    table.add_column("ID", justify="right", style="cyan")
-    table.add_column("Name", style="magenta")
-    table.add_column("Category", style="blue")
-    table.add_column("Price", style="green")
-    table.add_column("Stock", style="yellow")
-
-    for p in products:
-        stock_text = str(p["stock"]) if p["stock"] > 0 else "[red]Out of Stock[/red]"
-        table.add_row(str(p["id"]), p["name"], p["category"], f"${p['price']:.2f}", stock_text)
-
-    console.print(table)
+    rows = [
+        (
+            str(p["id"]),
+            p["name"],
+            p["category"],
+            f"${p['price']:.2f}",
+            str(p["stock"]) if p["stock"] > 0 else _OUT_OF_STOCK,
+        )
+        for p in products
+    ]
+    console.print(_new_table("Product Catalogue", _PRODUCT_COLUMNS, rows))
 
 
 # ---------Shopping cart display----------------------------------------------------------
@@ -37,22 +76,12 @@ def display_cart_table(cart):
         console.print("[yellow]Cart is empty[/yellow]")
         return
 
-    table = Table(title="Your Shopping Cart")
-    table.add_column("Product", style="cyan")
-    table.add_column("Qty", justify="right", style="yellow")
-    table.add_column("Price", justify="right", style="green")
-    table.add_column("Subtotal", justify="right", style="magenta")
-
-    for item in items:
-        table.add_row(
-            item["name"],
-            str(item["qty"]),
-            f"${item['price']:.2f}",
-            f"${item['subtotal']:.2f}"
-        )
-
-    console.print(table)
-    console.print(f"\n[bold green]Total: ${cart.get('total', 0.0):.2f}[/bold green]")
+    rows = [
+        (item["name"], str(item["qty"]), f"${item['price']:.2f}", f"${item['subtotal']:.2f}")
+        for item in items
+    ]
+    total = f"\n[bold green]Total: ${cart.get('total', 0.0):.2f}[/bold green]"
+    console.print(Group(_new_table("Your Shopping Cart", _LINE_ITEM_COLUMNS, rows), total))
 
 
 # ----------Invoice display-----------------------------------------------------------
@@ -62,35 +91,29 @@ def display_invoice_table(invoice):
         console.print(f"[red]{invoice.get('message', 'Invoice not found')}[/red]")
         return
 
-    console.print("\n[bold cyan]Invoice Summary[/bold cyan]")
-    console.print(
+    summary = (
+        "\n[bold cyan]Invoice Summary[/bold cyan]\n"
         f"[dim]Order ID:[/dim] {invoice['order_id']}   "
         f"[dim]Invoice ID:[/dim] {invoice['invoice_id']}   "
-        f"[dim]Method:[/dim] {invoice['payment_method']}"
-    )
-    console.print(
+        f"[dim]Method:[/dim] {invoice['payment_method']}\n"
         f"[dim]Status:[/dim] "
         f"{'[green]Paid[/green]' if invoice['paid'] else '[red]Unpaid[/red]'}   "
         f"[dim]Total:[/dim] [bold cyan]${invoice['total']:.2f}[/bold cyan]\n"
     )
 
-    table = Table(title="Invoice Details")
-    table.add_column("Product", style="cyan")
-    table.add_column("Qty", justify="right", style="yellow")
-    table.add_column("Price", justify="right", style="green")
-    table.add_column("Subtotal", justify="right", style="magenta")
-
-    for item in invoice["items"]:
-        subtotal = item["quantity"] * item["price"]
-        table.add_row(
+    rows = [
+        (
             item["product"],
             str(item["quantity"]),
             f"${item['price']:.2f}",
-            f"${subtotal:.2f}"
+            f"${item['quantity'] * item['price']:.2f}",
         )
+        for item in invoice["items"]
+    ]
+    table = _new_table("Invoice Details", _LINE_ITEM_COLUMNS, rows)
 
-    console.print(table)
-    console.print()
+    # Render the summary and table in one pass with a single write
+    console.print(Group(summary, table, ""))
 
 
 # -----------Report display---------------------------------------------------------------------
@@ -100,14 +123,8 @@ def display_report_table(report):
         console.print("[yellow]No report data available[/yellow]")
         return
 
-    table = Table(title="Report Summary")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", justify="right", style="green")
-
-    for r in report:
-        table.add_row(r["metric"], str(r["value"]))
-
-    console.print(table)
+    rows = [(r["metric"], str(r["value"])) for r in report]
+    console.print(_new_table("Report Summary", _REPORT_COLUMNS, rows))
 
 
 # ---------Orders display-----------------------------------------------------
@@ -117,26 +134,24 @@ def display_orders_table(orders: list):
         console.print("[yellow]No orders found.[/yellow]")
         return
 
+    # Collect every order's table (plus a spacer line) and render them in one pass
+    renderables = []
     for order in orders:
-        table = Table(
-            title=f"Order ID: {order['id']} | "
-                  f"Status: {order['status']} | "
-                  f"Total: ${order['total']:.2f}"
+        title = (
+            f"Order ID: {order['id']} | "
+            f"Status: {order['status']} | "
+            f"Total: ${order['total']:.2f}"
         )
-        table.add_column("Product ID", justify="right")
-        table.add_column("Name")
-        table.add_column("Qty", justify="right")
-        table.add_column("Price", justify="right")
-        table.add_column("Subtotal", justify="right")
-
-        for item in order.get("items", []):
-            table.add_row(
+        rows = [
+            (
                 str(item["product_id"]),
                 item["name"],
                 str(item["quantity"]),
                 f"${item['price']:.2f}",
-                f"${item['subtotal']:.2f}"
+                f"${item['subtotal']:.2f}",
             )
+            for item in order.get("items", [])
+        ]
+        renderables += [_new_table(title, _ORDER_COLUMNS, rows), ""]
 
-        console.print(table)
-        console.print()  # space between orders
+    console.print(Group(*renderables))
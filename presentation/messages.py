@@ -0,0 +1,9 @@
+"""
+User-facing message text shared by the CLI entry point and controller.
+Keeps the wording of common prompts and errors in one place.
+"""
+
+LOGIN_REQUIRED = "Please login first"
+ROLE_REQUIRED = "{role} access required"
+NOT_LOGGED_IN = "Not logged in"
+CART_EMPTY = "Cart is empty"
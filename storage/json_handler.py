@@ -6,36 +6,235 @@ Handles file creation, atomic saves, and basic error recovery.
 import json
 import os
 import shutil
+import stat
+import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Tuple, Union
+from app_config import SYNC_WRITES
+
+try:
+    import orjson  # optional C parser; stdlib json is used when it's missing
+except ImportError:
+    orjson = None
+
+# Only Windows can refuse os.replace on a file another process holds open
+_IS_WINDOWS = os.name == "nt"
+
+# Serializes the fallback umask probe in _current_umask
+_umask_lock = threading.Lock()
+
+# Parsed file contents keyed by path, valid while (mtime_ns, size, inode) is unchanged
+_cache: Dict[Path, Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = {}
+
+
+class UnreadableFileError(ValueError):
+    """Raised when a non-empty data file doesn't parse, e.g. after an interrupted append."""
+
+
+def _current_umask() -> int:
+    """
+    Return the process umask. Linux reports it in /proc; elsewhere it has to be set
+    to read it, so it is briefly swapped for a restrictive 077 rather than 0.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    with _umask_lock:
+        mask = os.umask(0o077)
+        os.umask(mask)
+    return mask
+
+
+def _stat_key(file_path: Union[Path, int]) -> Tuple[int, int, int]:
+    st = os.stat(file_path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
 
 
 class JSONHandler:
     """Handles safe JSON file I/O."""
 
+    @staticmethod
+    def loads(raw: bytes) -> Any:
+        """Parse JSON bytes, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    @staticmethod
+    def dumps(data: Any) -> bytes:
+        """Serialize data to compact JSON bytes, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
     @staticmethod
     def read_json(file_path: Path) -> List[Dict[str, Any]]:
-        """Read a JSON file and return its contents (empty list if missing or invalid)."""
-        if not file_path.exists():
+        """
+        Read a JSON file and return its contents (empty list if missing or empty).
+        Raises UnreadableFileError if the file has content that doesn't parse.
+        Unchanged files are served from the parse cache, so the returned list is
+        shared: callers that mutate it must persist it with write_json/append_json.
+        """
+        try:
+            key = _stat_key(file_path)
+        except FileNotFoundError:
+            _cache.pop(file_path, None)
             file_path.write_text("[]")
             return []
+
+        cached = _cache.get(file_path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        # Key the entry on the descriptor actually read, not the earlier path stat,
+        # so a file replaced in between is never cached under the old key
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            with open(file_path, "rb") as f:
+                key = _stat_key(f.fileno())
+                raw = f.read()
+        except FileNotFoundError:
+            return []
+        if not raw.strip():
             return []
+        try:
+            data = JSONHandler.loads(raw)
+        except ValueError:
+            raise UnreadableFileError(f"{file_path.name} is not valid JSON") from None
+        _cache[file_path] = (key, data)
+        return data
+
+    @staticmethod
+    def _remember(file_path: Path, data: List[Dict[str, Any]]) -> None:
+        """Record `data` as the parsed contents of a file that was just written."""
+        try:
+            _cache[file_path] = (_stat_key(file_path), data)
+        except FileNotFoundError:
+            _cache.pop(file_path, None)
+
+    @staticmethod
+    def append_json(file_path: Path, data: List[Dict[str, Any]]) -> bool:
+        """
+        Persist `data`, whose only change since it was read is a new last record,
+        by rewriting just the file's closing bracket.
+        Returns False, leaving the file untouched, if it doesn't end in a JSON array.
+        """
+        record = data[-1]
+        try:
+            with open(file_path, "r+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                start = f.seek(max(0, size - 64))
+                tail = f.read().rstrip()
+                body = tail[:-1].rstrip()
+                if not tail.endswith(b"]") or (not body and start):
+                    return False
+
+                separator = b"" if body.endswith(b"[") else b","
+                f.seek(start + len(tail) - 1)
+                f.write(separator + JSONHandler.dumps(record) + b"]")
+                f.truncate()
+                if SYNC_WRITES:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except FileNotFoundError:
+            return False
+        JSONHandler._remember(file_path, data)
+        return True
 
     @staticmethod
     def write_json(file_path: Path, data: List[Dict[str, Any]]) -> None:
-        """Write JSON data atomically with a Windows-safe fallback."""
-        tmp_path = file_path.with_suffix(".tmp")
+        """
+        Write JSON data atomically with a Windows-safe fallback.
+        Raises UnreadableFileError instead of replacing a file that holds unparseable
+        JSON (e.g. one cut short by an interrupted append), so its records aren't lost.
+        """
+        if JSONHandler._is_unreadable(file_path):
+            raise UnreadableFileError(f"{file_path.name} is not valid JSON; refusing to overwrite it")
+        _cache.pop(file_path, None)
+
+        # Write to a uniquely named temp file first, so concurrent writers never share one
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=file_path.stem, suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            try:
+                if not _IS_WINDOWS:
+                    os.fchmod(fd, JSONHandler._file_mode(file_path))
+                JSONHandler._write_all(fd, JSONHandler.dumps(data))
+                if SYNC_WRITES:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            if _IS_WINDOWS:
+                JSONHandler._replace(tmp_path, file_path)
+            else:
+                os.replace(tmp_path, file_path)
+            if SYNC_WRITES:
+                JSONHandler._sync_dir(file_path.parent)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        JSONHandler._remember(file_path, data)
+
+    @staticmethod
+    def _is_unreadable(file_path: Path) -> bool:
+        """Return True if the file exists and is non-empty but doesn't parse as JSON."""
+        try:
+            key = _stat_key(file_path)
+        except FileNotFoundError:
+            return False
+        cached = _cache.get(file_path)
+        if cached and cached[0] == key:
+            return False
+        try:
+            raw = file_path.read_bytes()
+            if raw.strip():
+                JSONHandler.loads(raw)
+        except FileNotFoundError:
+            return False
+        except ValueError:
+            return True
+        return False
+
+    @staticmethod
+    def _file_mode(file_path: Path) -> int:
+        """
+        Permissions for a rewrite: the existing file's, or 0666 minus the umask for a new one
+        (mkstemp would otherwise leave every data file as 0600).
+        """
+        try:
+            return stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            return 0o666 & ~_current_umask()
 
-        # Write to a temporary file first
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+    @staticmethod
+    def _sync_dir(dir_path: Path) -> None:
+        """
+        Fsync a directory so a rename into it is durable.
+        Skipped where directories can't be opened (no O_DIRECTORY, e.g. Windows).
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
-        # Replace file safely (retry if file is locked)
+    @staticmethod
+    def _write_all(fd: int, blob: bytes) -> None:
+        """Write bytes straight to a file descriptor, bypassing Python's buffered file layer."""
+        view = memoryview(blob)
+        while view:
+            view = view[os.write(fd, view):]
+
+    @staticmethod
+    def _replace(tmp_path: Path, file_path: Path) -> None:
+        """Move the temp file over the target on Windows (retry if file is locked)."""
         try:
             os.replace(tmp_path, file_path)
         except PermissionError:
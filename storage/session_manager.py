@@ -5,8 +5,9 @@ Stores the currently logged-in user between commands.
 
 import json
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from app_config import DATA_DIR
+from storage.json_handler import JSONHandler
 
 SESSION_FILE = DATA_DIR / "session.json"
 
@@ -14,26 +15,47 @@ SESSION_FILE = DATA_DIR / "session.json"
 class SessionManager:
     """Manages user login sessions using a simple JSON file."""
 
-    @staticmethod
-    def save_session(user_data: Dict) -> None:
+    # (mtime_ns, size, inode) of the session file and the session parsed from it
+    _cached: Optional[Tuple[Tuple[int, int, int], Optional[Dict]]] = None
+
+    @classmethod
+    def save_session(cls, user_data: Dict) -> None:
         """Save the current user's session to disk."""
-        with open(SESSION_FILE, "w") as f:
-            json.dump(user_data, f, indent=2)
+        with open(SESSION_FILE, "wb") as f:
+            f.write(JSONHandler.dumps(user_data))
+        cls._cached = (cls._stat_key(), user_data or None)
 
-    @staticmethod
-    def load_session() -> Optional[Dict]:
-        """Load session from file if it exists."""
-        if not SESSION_FILE.exists():
+    @classmethod
+    def load_session(cls) -> Optional[Dict]:
+        """Load session from file if it exists (re-parsed only when the file changes)."""
+        try:
+            key = cls._stat_key()
+        except FileNotFoundError:
+            cls._cached = None
             return None
+        if cls._cached and cls._cached[0] == key:
+            return cls._cached[1]
+        session = cls._read_session()
+        cls._cached = (key, session)
+        return session
+
+    @staticmethod
+    def _stat_key() -> Tuple[int, int, int]:
+        st = SESSION_FILE.stat()
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    @staticmethod
+    def _read_session() -> Optional[Dict]:
+        """Reads the session file from disk."""
         try:
-            with open(SESSION_FILE, "r") as f:
-                data = json.load(f)
+            with open(SESSION_FILE, "rb") as f:
+                data = JSONHandler.loads(f.read())
                 return data if data else None
         except (json.JSONDecodeError, FileNotFoundError):
             return None
 
-    @staticmethod
-    def clear_session() -> None:
+    @classmethod
+    def clear_session(cls) -> None:
         """Remove session file (logout)."""
-        if SESSION_FILE.exists():
-            SESSION_FILE.unlink()
+        SESSION_FILE.unlink(missing_ok=True)
+        cls._cached = None
@@ -4,17 +4,57 @@ Provides CRUD operations and maps logical entities (orders, products, etc.)
 to their corresponding data files.
 """
 
-from typing import List, Dict, Any, Optional
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Dict, Any, Optional
 from app_config import (
-    CUSTOMERS_FILE, ACCOUNTS_FILE, PRODUCTS_FILE, INVENTORY_FILE,
+    DATA_DIR, CUSTOMERS_FILE, ACCOUNTS_FILE, PRODUCTS_FILE, INVENTORY_FILE,
     ORDERS_FILE, INVOICES_FILE, PAYMENTS_FILE, SHIPMENTS_FILE,
     CARTS_FILE, STAFF_FILE
 )
-from storage.json_handler import JSONHandler
+from storage.json_handler import JSONHandler, UnreadableFileError
+
+
+class _RecordIndex:
+    """id -> record map and highest id for one entity's loaded record list."""
+
+    __slots__ = ("records", "size", "by_id", "max_id")
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = records
+        self.size = len(records)
+        # Every stored record gets an id from add(), so index on it directly
+        self.by_id = {r["id"]: r for r in records}
+        self.max_id = max(self.by_id, default=0)
+
+    def is_current(self, records: List[Dict[str, Any]]) -> bool:
+        """True while `records` is the same, un-resized list the index was built from."""
+        return records is self.records and len(records) == self.size
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the list and the index together."""
+        self.records.append(record)
+        self.size += 1
+        self.by_id[record["id"]] = record
+        self.max_id = max(self.max_id, record["id"])
+
+    def remove(self, record_id: int) -> bool:
+        """Remove a record from the list and the index in place; False if it isn't there."""
+        rec = self.by_id.pop(record_id, None)
+        if rec is None:
+            return False
+        # Match by identity; list.remove would compare every dict by value
+        for i, r in enumerate(self.records):
+            if r is rec:
+                del self.records[i]
+                break
+        self.size -= 1
+        return True
 
 
 class StorageManager:
-    """Main interface for all file-based persistence."""
+    """Main interface for all file-based persistence (Singleton)."""
 
     _file_map = {
         "customers": CUSTOMERS_FILE,
@@ -29,66 +69,149 @@ class StorageManager:
         "staff": STAFF_FILE,
     }
 
+    # Directory holding the files above; ensure_files lists it to find missing ones
+    base_path = DATA_DIR
+
+    # entity -> index over the record list last returned by load()
+    _indexes: Dict[str, _RecordIndex] = {}
+
+    # Saves staged by an open transaction(), written once when the outermost one exits
+    _pending: Dict[str, List[Dict[str, Any]]] = {}
+    _batch_depth = 0
+
+    _instance = None
+
+    def __new__(cls):
+        """Returns the shared StorageManager, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
         self.json_handler = JSONHandler()
         self.ensure_files()
 
     def ensure_files(self) -> None:
         """Create empty JSON files if they don't exist."""
+        # One directory listing instead of a stat per data file
+        existing = {entry.name for entry in os.scandir(self.base_path)}
         for path in self._file_map.values():
-            if not path.exists():
+            if path.name not in existing:
                 self.json_handler.write_json(path, [])
 
     def load(self, entity: str) -> List[Dict[str, Any]]:
         """Load all records for the given entity."""
-        file_path = self._file_map.get(entity)
-        if not file_path:
-            raise ValueError(f"Unknown entity type: {entity}")
+        file_path = self._path(entity)
+        pending = self._pending.get(entity)
+        if pending is not None:
+            return pending
         return self.json_handler.read_json(file_path)
 
+    def load_many(self, *entities: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Load several entities at once, keyed by entity name."""
+        return {entity: self.load(entity) for entity in entities}
+
     # Backwards-compatible aliases
     get_all = load
     read = load
 
     def save_all(self, entity: str, data: List[Dict[str, Any]]) -> None:
-        """Save all records for an entity."""
-        file_path = self._file_map.get(entity)
+        """Save all records for an entity (deferred while a transaction is open)."""
+        file_path = self._path(entity)
+        if self._batch_depth:
+            self._pending[entity] = data
+            return
+        self._write(entity, file_path, data)
+
+    @classmethod
+    def _path(cls, entity: str) -> Path:
+        """Resolve an entity name to its data file."""
+        try:
+            return cls._file_map[entity]
+        except KeyError:
+            raise ValueError(f"Unknown entity type: {entity}") from None
+
+    @staticmethod
+    def _write(entity: str, file_path: Path, data: List[Dict[str, Any]]) -> None:
         try:
-            self.json_handler.write_json(file_path, data)
+            JSONHandler.write_json(file_path, data)
+        except UnreadableFileError:
+            # The caller's records were never stored; let it fail instead of carrying on
+            raise
         except Exception as e:
             print(f"[ERROR] Failed to save {entity}: {e}")
 
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[None]:
+        """
+        Groups the saves made inside the block so each entity is written once on exit.
+        Nested transactions join the outermost one. Staged data is flushed even if
+        the block raises, since the in-memory records have already been changed.
+        """
+        cls._batch_depth += 1
+        try:
+            yield
+        finally:
+            cls._batch_depth -= 1
+            if not cls._batch_depth:
+                pending, cls._pending = cls._pending, {}
+                refused = None
+                for entity, data in pending.items():
+                    # Keep flushing the other entities if one file refuses the write
+                    try:
+                        cls._write(entity, cls._path(entity), data)
+                    except UnreadableFileError as e:
+                        refused = refused or e
+                if refused:
+                    raise refused
+
     def add(self, entity: str, record: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new record with an auto-incremented ID."""
-        records = self.load(entity)
-        max_id = max((r.get("id", 0) for r in records), default=0)
-        record["id"] = max_id + 1
-        records.append(record)
-        self.save_all(entity, records)
+        index = self._indexed(entity)
+        record["id"] = index.max_id + 1
+        index.append(record)
+        records = index.records
+
+        # Append in place instead of rewriting the whole file; the first record
+        # is always a full write so an unreadable file gets replaced, not extended
+        in_place = len(records) > 1 and not self._batch_depth
+        if not (in_place and self.json_handler.append_json(self._path(entity), records)):
+            self.save_all(entity, records)
         return record
 
     def update(self, entity: str, record_id: int, updates: Dict[str, Any]) -> bool:
         """Update a record by its ID."""
-        records = self.load(entity)
-        for rec in records:
-            if rec.get("id") == record_id:
-                rec.update(updates)
-                self.save_all(entity, records)
-                return True
-        return False
+        index = self._indexed(entity)
+        rec = index.by_id.get(record_id)
+        if rec is None:
+            return False
+        # Skip the rewrite when every field already holds the requested value
+        if any(k not in rec or rec[k] != v for k, v in updates.items()):
+            rec.update(updates)
+            self.save_all(entity, index.records)
+        return True
 
     def delete(self, entity: str, record_id: int) -> bool:
         """Delete a record by its ID."""
-        records = self.load(entity)
-        new_records = [r for r in records if r.get("id") != record_id]
-        if len(new_records) != len(records):
-            self.save_all(entity, new_records)
-            return True
-        return False
+        index = self._indexed(entity)
+        if not index.remove(record_id):
+            return False
+        self.save_all(entity, index.records)
+        return True
 
     def find_by_id(self, entity: str, record_id: int) -> Optional[Dict[str, Any]]:
         """Find a record by its ID."""
-        for rec in self.load(entity):
-            if rec.get("id") == record_id:
-                return rec
-        return None
+        return self._indexed(entity).by_id.get(record_id)
+
+    def _indexed(self, entity: str) -> _RecordIndex:
+        """Load an entity's index, rebuilt only when its record list changes."""
+        records = self.load(entity)
+        index = self._indexes.get(entity)
+        if index is None or not index.is_current(records):
+            index = self._indexes[entity] = _RecordIndex(records)
+        return index
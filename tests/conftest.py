@@ -0,0 +1,74 @@
+"""
+Shared pytest fixtures for the OCSS test suite.
+Sample data is seeded once per session; each test gets its own copy in a temp directory.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from business.models.inventory import Inventory
+from business.services.auth_service import AuthService
+from business.services.cart_service import CartService
+from business.services.order_service import OrderService
+from storage import session_manager
+from storage.storage_manager import StorageManager
+
+
+def _redirect_data_dir(mp: pytest.MonkeyPatch, path: Path) -> None:
+    """Point every data file and the session file at `path`."""
+    mp.setattr(StorageManager, "base_path", path)
+    mp.setattr(StorageManager, "_file_map", {e: path / p.name for e, p in StorageManager._file_map.items()})
+    mp.setattr(session_manager, "SESSION_FILE", path / "session.json")
+
+
+@pytest.fixture(scope="session")
+def seed_snapshot(tmp_path_factory):
+    """
+    Seed the sample data once in a scratch directory and keep each file's bytes,
+    plus the Inventory singleton's stock levels as they stood after seeding.
+    """
+    seed_dir = tmp_path_factory.mktemp("seed")
+    with pytest.MonkeyPatch.context() as mp:
+        _redirect_data_dir(mp, seed_dir)
+        AuthService().initialize_system()
+        stock = dict(Inventory.get_instance()._stock_cache)
+    with os.scandir(seed_dir) as entries:
+        files = {
+            e.name: Path(e.path).read_bytes()
+            for e in entries
+            if e.is_file() and e.name.endswith(".json")
+        }
+    return {"files": files, "stock": stock}
+
+
+@pytest.fixture(scope="function")
+def data_dir(seed_snapshot, tmp_path, monkeypatch):
+    """
+    Give the test its own data directory holding a fresh copy of the sample data,
+    and put the Inventory singleton's stock back to the seeded levels.
+    """
+    _redirect_data_dir(monkeypatch, tmp_path)
+    for name, raw in seed_snapshot["files"].items():
+        (tmp_path / name).write_bytes(raw)
+
+    # Copying the seeded stock is cheaper than reloading inventory.json
+    Inventory.get_instance()._stock_cache = dict(seed_snapshot["stock"])
+    return tmp_path
+
+
+@pytest.fixture
+def auth_service(data_dir):
+    """Return an AuthService over freshly restored sample data."""
+    return AuthService()
+
+
+@pytest.fixture
+def cart_service(auth_service):
+    return CartService()
+
+
+@pytest.fixture
+def order_service(auth_service):
+    return OrderService()
@@ -4,13 +4,10 @@ Covers login, cart, checkout, inventory, reports, and staff operations.
 Run with: pytest -v
 """
 
-import pytest
-from pathlib import Path
-import sys
-from decimal import Decimal
+import os
+import stat
 
-# Allow local imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from business.models.customer import Customer
 from business.models.product import Product
@@ -18,47 +15,14 @@ from business.models.inventory import Inventory
 from business.models.cart import Cart
 from business.models.order import Order
 from business.models.account import Account
-from business.services.auth_service import AuthService
-from business.services.cart_service import CartService
-from business.services.order_service import OrderService
 from business.services.report_service import ReportService
 from storage.storage_manager import StorageManager
+from storage import json_handler
+from storage.json_handler import UnreadableFileError
+from storage.session_manager import SessionManager
 from business.exceptions.errors import InsufficientStockError, CartEmptyError
 
 
-# ---------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------
-@pytest.fixture(scope="function")
-def clean_data_files():
-    """Ensure a clean data directory for each test run."""
-    data_dir = Path("data")
-    if data_dir.exists():
-        for f in data_dir.glob("*.json"):
-            f.unlink()
-    yield
-    for f in data_dir.glob("*.json"):
-        f.unlink()
-
-
-@pytest.fixture
-def auth_service(clean_data_files):
-    """Initialize sample data and return AuthService."""
-    service = AuthService()
-    service.initialize_system()
-    return service
-
-
-@pytest.fixture
-def cart_service(auth_service):
-    return CartService()
-
-
-@pytest.fixture
-def order_service(auth_service):
-    return OrderService()
-
-
 # ---------------------------------------------------------------------
 # Authentication
 # ---------------------------------------------------------------------
@@ -87,6 +51,13 @@ def test_logout(auth_service):
     assert auth_service.get_current_user() is None
 
 
+def test_session_follows_file_changes(auth_service, data_dir):
+    auth_service.login("customer1", "Password123!")
+    assert SessionManager.load_session()["user_type"] == "customer"
+    (data_dir / "session.json").unlink()
+    assert SessionManager.load_session() is None
+
+
 # ---------------------------------------------------------------------
 # Products and Inventory
 # ---------------------------------------------------------------------
@@ -102,12 +73,6 @@ def test_browse_by_category(cart_service):
     assert all(p["category"] == "Dairy" for p in products)
 
 
-def test_inventory_singleton(auth_service):
-    inv1 = Inventory.get_instance()
-    inv2 = Inventory.get_instance()
-    assert inv1 is inv2
-
-
 def test_inventory_stock_check(auth_service):
     inv = Inventory.get_instance()
     assert inv.check_stock(1) == 50
@@ -120,9 +85,16 @@ def test_inventory_reserve_stock(auth_service):
     assert inv.check_stock(1) == before - 5
 
 
+def test_inventory_release_batch_is_all_or_nothing(auth_service):
+    inv = Inventory.get_instance()
+    with pytest.raises(ValueError, match="Quantity must be positive"):
+        inv.release_batch([{"product_id": 1, "qty": 5}, {"product_id": 2, "qty": 0}])
+    assert inv.check_stock(1) == 50
+
+
 def test_inventory_insufficient_stock(auth_service):
     inv = Inventory.get_instance()
-    with pytest.raises(InsufficientStockError):
+    with pytest.raises(InsufficientStockError, match="Only 50 units available"):
         inv.reserve_stock(1, 9999)
 
 
@@ -135,16 +107,15 @@ def test_add_item_to_cart(auth_service, cart_service):
     assert "Added 2x Milk" in result["message"]
 
 
-def test_add_invalid_product(auth_service, cart_service):
-    result = cart_service.add_item(1, 999, 1)
-    assert not result["success"]
-    assert "Product not found" in result["message"]
-
-
-def test_add_insufficient_stock(auth_service, cart_service):
-    result = cart_service.add_item(1, 1, 9999)
+@pytest.mark.parametrize("product_id, qty, expected", [
+    (999, 1, "Product not found"),
+    (1, 9999, "Only 50 units available"),
+    (1, 0, "Quantity must be positive"),
+])
+def test_add_item_errors(auth_service, cart_service, product_id, qty, expected):
+    result = cart_service.add_item(1, product_id, qty)
     assert not result["success"]
-    assert "available" in result["message"].lower()
+    assert expected in result["message"]
 
 
 def test_view_cart(auth_service, cart_service):
@@ -152,68 +123,156 @@ def test_view_cart(auth_service, cart_service):
     cart_service.add_item(1, 2, 3)
     cart = cart_service.get_cart(1)
     assert len(cart["items"]) == 2
-    assert cart["total"] == pytest.approx((2 * 3.5) + (3 * 4.2))
+    assert cart["total_cents"] == 1960
 
 
 def test_cart_quantity_update(auth_service, cart_service):
     cart_service.add_item(1, 1, 2)
     cart_service.add_item(1, 1, 3)
     cart = cart_service.get_cart(1)
-    milk = next(i for i in cart["items"] if i["product_id"] == 1)
-    assert milk["qty"] == 5
+    assert len(cart["items"]) == 1
+    assert cart["items_by_id"][1]["qty"] == 5
+
+
+def test_remove_item_from_cart(auth_service, cart_service):
+    cart_service.add_item(1, 1, 2)
+    cart_service.add_item(1, 2, 1)
+    assert cart_service.remove_item(1, 1)["success"]
+    assert [i["product_id"] for i in cart_service.get_cart(1)["items"]] == [2]
+    assert not cart_service.remove_item(1, 1)["success"]
 
 
 def test_view_empty_cart(auth_service, cart_service):
     cart = cart_service.get_cart(1)
     assert cart["items"] == []
-    assert cart["total"] == 0.0
+    assert cart["total_cents"] == 0
 
 
 # ---------------------------------------------------------------------
 # Checkout & Orders
 # ---------------------------------------------------------------------
 def test_checkout_success(auth_service, cart_service, order_service):
+    inv = Inventory.get_instance()
+    before = inv.check_stock(1)
     cart_service.add_item(1, 1, 2)
     result = order_service.create_order(1)
     assert result["success"]
     assert result["order_id"] == 1
     assert result["total"] == 7.0
 
+    # Side effects: stock taken, cart emptied, paid invoice and approved card payment recorded
+    assert inv.check_stock(1) == before - 2
+    assert not cart_service.get_cart(1)["items"]
+    invoice = StorageManager().load("invoices")[0]
+    payment = StorageManager().load("payments")[0]
+    assert invoice["order_id"] == payment["order_id"] == result["order_id"]
+    assert invoice["paid"]
+    assert payment["status"] == "APPROVED"
+    assert payment["method"] == "card"
+
 
 def test_checkout_empty_cart(auth_service, order_service):
-    with pytest.raises(CartEmptyError):
+    with pytest.raises(CartEmptyError, match="empty cart"):
         order_service.create_order(1)
 
 
-def test_checkout_reduces_inventory(auth_service, cart_service, order_service):
+def test_failed_checkout_does_not_over_release_stock(auth_service, cart_service):
     inv = Inventory.get_instance()
-    before = inv.check_stock(1)
     cart_service.add_item(1, 1, 2)
-    order_service.create_order(1)
-    assert inv.check_stock(1) == before - 2
+    cart_service.add_item(1, 2, 3)
+    inv.set_stock(2, 1)
+    result = Customer.find_by_id(1).checkout_via("card")
+    assert not result["success"]
+    assert inv.check_stock(1) == 50
+    assert inv.check_stock(2) == 1
 
 
-def test_checkout_clears_cart(auth_service, cart_service, order_service):
+def test_checkout_via_reports_reservation_errors(auth_service, cart_service, monkeypatch):
     cart_service.add_item(1, 1, 2)
-    order_service.create_order(1)
-    cart = cart_service.get_cart(1)
-    assert not cart["items"]
-
-
-def test_checkout_creates_invoice(auth_service, cart_service, order_service):
+    def broken(self, items):
+        raise ValueError("Quantity must be positive")
+    monkeypatch.setattr(Inventory, "reserve_batch", broken)
+    result = Customer.find_by_id(1).checkout_via("card")
+    assert not result["success"]
+    assert "Stock reservation failed" in result["message"]
+
+
+def test_storage_add_appends_records(auth_service):
+    storage = StorageManager()
+    storage.add("shipments", {"order_id": 1})
+    storage.add("shipments", {"order_id": 2})
+    storage.add("shipments", {"order_id": 3})
+    assert [s["id"] for s in storage.load("shipments")] == [1, 2, 3]
+    assert storage.find_by_id("shipments", 3)["order_id"] == 3
+
+
+def test_storage_update_and_delete(auth_service, data_dir):
+    storage = StorageManager()
+    storage.add("shipments", {"order_id": 1})
+    storage.add("shipments", {"order_id": 2})
+    assert storage.update("shipments", 2, {"status": "SHIPPED"})
+    assert storage.find_by_id("shipments", 2)["status"] == "SHIPPED"
+    mtime = (data_dir / "shipments.json").stat().st_mtime_ns
+    assert storage.update("shipments", 2, {"status": "SHIPPED"})
+    assert (data_dir / "shipments.json").stat().st_mtime_ns == mtime
+    assert storage.delete("shipments", 1)
+    assert storage.find_by_id("shipments", 1) is None
+    assert not storage.update("shipments", 1, {"status": "SHIPPED"})
+    assert not storage.delete("shipments", 1)
+
+
+def test_storage_transaction_defers_writes(auth_service, cart_service, order_service, data_dir):
     cart_service.add_item(1, 1, 2)
-    result = order_service.create_order(1)
-    invoices = StorageManager().load("invoices")
-    assert invoices and invoices[0]["order_id"] == result["order_id"]
-    assert invoices[0]["paid"]
-
-
-def test_checkout_creates_payment(auth_service, cart_service, order_service):
+    with StorageManager.transaction():
+        result = order_service.create_order(1)
+        assert StorageManager().find_by_id("orders", result["order_id"])
+        assert (data_dir / "orders.json").read_text() == "[]"
+    assert StorageManager().find_by_id("orders", result["order_id"])["status"] == "PAID"
+    assert (data_dir / "orders.json").read_text() != "[]"
+
+
+def test_storage_load_sees_external_edits(auth_service, data_dir):
+    storage = StorageManager()
+    assert storage.load("shipments") == []
+    (data_dir / "shipments.json").write_text('[{"id": 1, "order_id": 7}]')
+    assert storage.load("shipments")[0]["order_id"] == 7
+
+
+@pytest.mark.parametrize("has_o_directory", [True, False])
+def test_sync_writes_fsync_file_and_directory(auth_service, data_dir, monkeypatch, has_o_directory):
+    synced = []
+    real_fsync = os.fsync
+    def spy(fd):
+        synced.append("dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "file")
+        real_fsync(fd)
+    monkeypatch.setattr(json_handler, "SYNC_WRITES", True)
+    monkeypatch.setattr(os, "fsync", spy)
+    if not has_o_directory:
+        monkeypatch.delattr(os, "O_DIRECTORY", raising=False)
+    StorageManager().save_all("shipments", [{"id": 1, "order_id": 1}])
+    assert synced == (["file", "dir"] if has_o_directory else ["file"])
+
+
+def test_storage_keeps_unreadable_file(auth_service, data_dir):
+    storage = StorageManager()
+    storage.add("shipments", {"order_id": 1})
+    storage.add("shipments", {"order_id": 2})
+    truncated = (data_dir / "shipments.json").read_bytes()[:-10]
+    (data_dir / "shipments.json").write_bytes(truncated)
+    with pytest.raises(UnreadableFileError):
+        storage.add("shipments", {"order_id": 3})
+    with pytest.raises(UnreadableFileError):
+        storage.save_all("shipments", [])
+    assert (data_dir / "shipments.json").read_bytes() == truncated
+
+
+def test_checkout_fails_on_unreadable_orders(auth_service, cart_service, order_service, data_dir):
     cart_service.add_item(1, 1, 2)
+    (data_dir / "orders.json").write_text('[{"id": 1, "customer_id": 1')
     result = order_service.create_order(1)
-    payments = StorageManager().load("payments")
-    assert payments and payments[0]["order_id"] == result["order_id"]
-    assert payments[0]["status"] == "APPROVED"
+    assert not result["success"]
+    assert StorageManager().load("invoices") == []
+    assert Inventory.get_instance().check_stock(1) == 50
 
 
 # ---------------------------------------------------------------------
@@ -235,26 +294,23 @@ def test_ship_nonexistent_order(auth_service, order_service):
 # ---------------------------------------------------------------------
 # Reporting (Strategy Pattern)
 # ---------------------------------------------------------------------
-def test_daily_report(auth_service, cart_service, order_service):
+@pytest.mark.parametrize("kind, label", [
+    ("daily", "Daily"),
+    ("monthly", "Monthly"),
+    ("all", "All-Time"),
+])
+def test_report_by_type(auth_service, cart_service, order_service, kind, label):
     cart_service.add_item(1, 1, 2)
     order_service.create_order(1)
-    report = ReportService().generate("daily")
-    assert any(r["metric"] == "Report Type" and r["value"] == "Daily" for r in report)
-
-
-def test_monthly_report(auth_service):
-    report = ReportService().generate("monthly")
-    assert any(r["value"] == "Monthly" for r in report)
-
-
-def test_all_time_report(auth_service):
-    report = ReportService().generate("all")
-    assert any(r["value"] == "All-Time" for r in report)
+    report = ReportService().generate(kind)
+    assert report[0]["metric"] == "Report Type"
+    assert [r["value"] for r in report] == [label, 1, "7.00"]
 
 
 # ---------------------------------------------------------------------
 # Domain Model Integrity
 # ---------------------------------------------------------------------
+@pytest.mark.slow
 def test_customer_order_history(auth_service, cart_service, order_service):
     cart_service.add_item(1, 1, 1)
     order_service.create_order(1)
@@ -267,7 +323,7 @@ def test_customer_order_history(auth_service, cart_service, order_service):
 def test_product_find_by_id(auth_service):
     p = Product.find_by_id(1)
     assert p and p.name == "Milk 1L"
-    assert p.price == Decimal("3.5")
+    assert p.price_cents == 350
 
 
 def test_order_persistence(auth_service, cart_service, order_service):
@@ -276,7 +332,7 @@ def test_order_persistence(auth_service, cart_service, order_service):
     order = Order.find_by_id(result["order_id"])
     assert order
     assert order.customer.id == 1
-    assert order.total == Decimal("7.0")
+    assert order.total_cents == 700
     assert order.status == "PAID"
 
 
@@ -290,18 +346,8 @@ def test_singleton_pattern_inventory(auth_service):
     assert inv1 is inv2 is inv3
 
 
-def test_factory_method_payment(auth_service, cart_service, order_service):
-    cart_service.add_item(1, 1, 1)
-    order_service.create_order(1)
-    payments = StorageManager().load("payments")
-    assert payments[0]["method"] == "card"
-
-
-def test_strategy_pattern_reports(auth_service):
-    r = ReportService()
-    assert r.generate("daily")[0]["value"] == "Daily"
-    assert r.generate("monthly")[0]["value"] == "Monthly"
-    assert r.generate("all")[0]["value"] == "All-Time"
+def test_singleton_pattern_storage(auth_service):
+    assert StorageManager() is StorageManager()
 
 
 def test_staff_update_stock(auth_service):